@@ -0,0 +1,96 @@
+# Pure-Python, fully annotated formatting helpers kept apart from the network
+# code so they can be compiled ahead of time. Build from inside api_client/ so
+# the extension lands next to this file:
+#
+#     cd api_client && mypyc _formatting.py
+#
+# With the .so beside it, `from _formatting import ...` in the client scripts
+# loads the compiled module (extension modules are tried before .py files in
+# the same directory); delete the .so to go back to this source.
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # large polls are aggregated in pure Python instead
+    np = None  # type: ignore[assignment]
+
+
+# Below this many options the numpy conversion costs more than it saves
+_NUMPY_MIN_OPTIONS = 256
+
+
+def format_poll_results(results_data: Optional[Dict[str, Any]]) -> str:
+    """
+    Helper function to format poll results in a readable way.
+    
+    Args:
+        results_data (Dict): Poll results data from the API
+        
+    Returns:
+        str: Formatted string representation of the results
+    """
+    if not results_data:
+        return "No results data available"
+    
+    poll_id = results_data.get("poll_id", "Unknown")
+    question = results_data.get("question", "Unknown question")
+    results: List[Dict[str, Any]] = results_data.get("results", [])
+    
+    header = f"Poll #{poll_id}: {question}"
+    parts: List[str] = [header, "\n", "=" * len(header), "\n\n"]
+    
+    if not results:
+        parts.append("No votes cast yet.\n")
+        return "".join(parts)
+    
+    # Read each vote count once, then sort indices by it (descending)
+    votes: List[int]
+    order: List[int]
+    total_votes: int
+    if np is not None and len(results) >= _NUMPY_MIN_OPTIONS:
+        counts = np.fromiter(
+            (result.get("vote_count", 0) for result in results), dtype=np.int64, count=len(results)
+        )
+        total_votes = int(counts.sum())
+        # Stable sort on the negated counts keeps tied options in input order
+        order = np.argsort(-counts, kind="stable").tolist()
+        votes = counts.tolist()
+    else:
+        votes = [result.get("vote_count", 0) for result in results]
+        total_votes = sum(votes)
+        order = sorted(range(len(results)), key=votes.__getitem__, reverse=True)
+    parts.append(f"Total votes: {total_votes}\n\n")
+    
+    for i, index in enumerate(order, 1):
+        result = results[index]
+        vote_count = votes[index]
+        percentage = (vote_count / total_votes * 100) if total_votes > 0 else 0
+        parts.append(
+            f"{i}. {result.get('text', 'Unknown option')}\n"
+            f"   Votes: {vote_count} ({percentage:.1f}%)\n"
+            f"   Option ID: {result.get('option_id', 'Unknown')}\n\n"
+        )
+    
+    return "".join(parts)
+
+
+def summarize_votes(results: List[Dict[str, Any]]) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """
+    Compute the total vote count and the most popular option in one pass.
+    
+    Args:
+        results (List[Dict]): The "results" list from a PollResults payload
+        
+    Returns:
+        Tuple[int, Optional[Dict]]: Total votes and the first option with the
+            highest vote count (None if there are no options)
+    """
+    total: int = 0
+    best_index: int = -1
+    best_votes: int = -1
+    for i, result in enumerate(results):
+        votes: int = result.get("vote_count", 0) or 0
+        total += votes
+        if votes > best_votes:
+            best_votes, best_index = votes, i
+    return total, (results[best_index] if best_index >= 0 else None)
@@ -0,0 +1,173 @@
+import json
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as ReqConnError, HTTPError, RequestException, Timeout as ReqTimeout
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:  # HTTP/2 backend is optional
+    httpx = None
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib json module
+    orjson = None
+
+try:
+    import requests_unixsocket
+except ImportError:  # http+unix:// base URLs are unavailable without it
+    requests_unixsocket = None
+
+
+# Shared session so every client call reuses pooled keep-alive connections
+# instead of paying a fresh TCP/TLS handshake per request.
+SESSION = requests.Session()
+
+# Transient gateway errors are retried inside the pool, keeping the
+# connection alive. POST stays out of allowed_methods so a vote that reached
+# the server is never replayed; the final 5xx is returned, not raised.
+_retry = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+_adapter = HTTPAdapter(pool_connections=50, pool_maxsize=50, max_retries=_retry)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+# When the API runs on the same host (`uvicorn main:app --uds /tmp/polly.sock`),
+# pass base_url="http+unix://%2Ftmp%2Fpolly.sock" to skip the TCP stack.
+if requests_unixsocket is not None:
+    SESSION.mount("http+unix://", requests_unixsocket.UnixAdapter(pool_connections=50))
+
+# Content-Type is set per call: the form-encoded /login call must keep its
+# own type.
+SESSION.headers.update({"Accept": "application/json"})
+# Accept-Encoding keeps requests' default: it already advertises br (and
+# urllib3 decodes it) whenever the brotli package is installed.
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Poll results cache shared by get_poll_results (fill) and vote_on_poll
+# (evict). Bodies are stored as raw bytes so every hit decodes a fresh dict
+# that callers may mutate freely.
+# (base_url, poll_id) -> (expires_at, body, etag, last_modified)
+RESULTS_CACHE: Dict[Tuple[str, int], Tuple[float, bytes, Optional[str], Optional[str]]] = {}
+RESULTS_CACHE_MAX = 1024
+RESULTS_LOCK = threading.Lock()
+
+
+def store_results(key: Tuple[str, int], entry: Tuple[float, bytes, Optional[str], Optional[str]]) -> None:
+    """Insert a results cache entry, pruning expired and then oldest entries when full."""
+    with RESULTS_LOCK:
+        RESULTS_CACHE.pop(key, None)
+        if len(RESULTS_CACHE) >= RESULTS_CACHE_MAX:
+            now = time.monotonic()
+            for stale in [k for k, cached in RESULTS_CACHE.items() if cached[0] <= now]:
+                del RESULTS_CACHE[stale]
+            while len(RESULTS_CACHE) >= RESULTS_CACHE_MAX:
+                del RESULTS_CACHE[next(iter(RESULTS_CACHE))]
+        RESULTS_CACHE[key] = entry
+
+
+def evict_results(base_url: str, poll_id: int) -> None:
+    """Drop the cached results of a poll, e.g. after a vote changed them."""
+    with RESULTS_LOCK:
+        RESULTS_CACHE.pop((base_url, poll_id), None)
+
+
+# Exception groups covering both backends, so a `client=httpx.Client` failure
+# is reported the same way as its requests counterpart.
+if httpx is not None:
+    CONNECT_ERRORS = (ReqConnError, httpx.ConnectError)
+    TIMEOUT_ERRORS = (ReqTimeout, httpx.TimeoutException)
+    REQUEST_ERRORS = (RequestException, httpx.HTTPError)
+else:
+    CONNECT_ERRORS = (ReqConnError,)
+    TIMEOUT_ERRORS = (ReqTimeout,)
+    REQUEST_ERRORS = (RequestException,)
+
+
+# Per-poll URLs are rebuilt on every call otherwise; the bounded caches hand
+# back the same string object for hot polls.
+@lru_cache(maxsize=4096)
+def results_url(base_url: str, poll_id: int) -> str:
+    return f"{base_url}/polls/{poll_id}/results"
+
+
+@lru_cache(maxsize=4096)
+def vote_url(base_url: str, poll_id: int) -> str:
+    return f"{base_url}/polls/{poll_id}/vote"
+
+
+def json_loads(data: bytes):
+    """Decode a JSON body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(payload) -> bytes:
+    """Encode a JSON request body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def response_json(response):
+    """Decode a requests/httpx response body as JSON."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def get_client():
+    """
+    Build an HTTP/2 httpx.Client as an alternative to SESSION.
+    
+    Pass it as the `client` argument of the client helpers. HTTP/2 is only
+    negotiated over TLS (ALPN), so concurrent calls are multiplexed over one
+    connection for https:// base URLs; against a plain http:// URL such as the
+    default http://localhost:8000 the client speaks HTTP/1.1.
+    
+    Returns:
+        httpx.Client: Client with HTTP/2 enabled
+        
+    Raises:
+        ImportError: If httpx is not installed
+    """
+    if httpx is None:
+        raise ImportError("httpx[http2] is required for the HTTP/2 client")
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=50),
+        headers={"Accept": "application/json"},
+        timeout=10.0,
+    )
+
+
+# Status handlers for per-endpoint dispatch tables:
+# handler = DISPATCH.get(response.status_code, http_error)
+def ok(response):
+    return response_json(response)
+
+
+def fail_with(message: str):
+    """Build a status handler that raises ValueError(message)."""
+    def handler(response):
+        raise ValueError(message)
+    return handler
+
+
+def http_error(response):
+    raise HTTPError(
+        f"HTTP {response.status_code} for url: {response.url}", response=response
+    )
@@ -0,0 +1,93 @@
+import asyncio
+from typing import Dict, List, Union
+
+import httpx
+
+from _http import json_loads, results_url
+
+
+def _async_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=30),
+        headers={"Accept": "application/json"},
+        timeout=10.0,
+    )
+
+
+async def _get_json(client: httpx.AsyncClient, url: str, params: Dict = None):
+    response = await client.get(url, params=params)
+    if response.status_code == 404:
+        raise ValueError("Poll not found")
+    response.raise_for_status()
+    # Parse off the event loop so other in-flight responses keep being read
+    return await asyncio.get_running_loop().run_in_executor(None, json_loads, response.content)
+
+
+async def get_poll_results_async(client: httpx.AsyncClient, poll_id: int, base_url: str = "http://localhost:8000") -> Dict:
+    """
+    Async counterpart of get_poll_results using a shared HTTP/2 client.
+    
+    Args:
+        client (httpx.AsyncClient): Open client to issue the request on
+        poll_id (int): The ID of the poll to get results for
+        base_url (str): The base URL of the API (default: http://localhost:8000)
+    
+    Returns:
+        Dict: Poll results following the PollResults schema
+        
+    Raises:
+        ValueError: If validation fails or the poll is not found
+        httpx.HTTPError: If the request fails
+    """
+    if not poll_id or poll_id <= 0:
+        raise ValueError("Poll ID must be a positive integer")
+    return await _get_json(client, results_url(base_url, poll_id))
+
+
+async def fetch_many_results(poll_ids: List[int], base_url: str = "http://localhost:8000") -> List[Union[Dict, Exception]]:
+    """
+    Fetch results for several polls concurrently.
+    
+    Args:
+        poll_ids (List[int]): IDs of the polls to get results for
+        base_url (str): The base URL of the API (default: http://localhost:8000)
+    
+    Returns:
+        List[Union[Dict, Exception]]: One entry per poll ID, in the same order;
+            failed lookups are returned as the raised exception
+    """
+    async with _async_client() as client:
+        return await asyncio.gather(
+            *(get_poll_results_async(client, poll_id, base_url) for poll_id in poll_ids),
+            return_exceptions=True,
+        )
+
+
+async def fetch_polls_pages(pages: int, limit: int = 10, base_url: str = "http://localhost:8000") -> List[Dict]:
+    """
+    Fetch several pages of /polls concurrently and flatten them in page order.
+    
+    Args:
+        pages (int): Number of pages to request (skip=0, limit, 2*limit, ...)
+        limit (int): Page size (default: 10)
+        base_url (str): The base URL of the API (default: http://localhost:8000)
+    
+    Returns:
+        List[Dict]: Poll objects following the PollOut schema
+        
+    Raises:
+        ValueError: If pages or limit are not positive
+        httpx.HTTPError: If any page request fails
+    """
+    if pages <= 0:
+        raise ValueError("Pages parameter must be positive")
+    if limit <= 0:
+        raise ValueError("Limit parameter must be positive")
+    
+    url = f"{base_url}/polls"
+    async with _async_client() as client:
+        results = await asyncio.gather(
+            *(_get_json(client, url, {"skip": page * limit, "limit": limit}) for page in range(pages))
+        )
+    return [poll for page in results for poll in page]
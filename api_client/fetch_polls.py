@@ -1,10 +1,23 @@
-import requests
 import json
-from typing import Dict, Optional, Tuple, List
+import ijson
+from typing import Dict, Optional, Tuple, List, Iterator, Union
 from datetime import datetime
 
+from requests import Session
+from requests.exceptions import RequestException
 
-def fetch_polls(skip: int = 0, limit: int = 10, base_url: str = "http://localhost:8000") -> List[Dict]:
+from _http import SESSION, response_json
+
+
+def _stream_polls(url: str, params: Dict, client=None) -> Iterator[Dict]:
+    with (client or SESSION).get(url, params=params, stream=True) as response:
+        response.raise_for_status()
+        # Let urllib3 undo any Content-Encoding before ijson sees the bytes
+        response.raw.decode_content = True
+        yield from ijson.items(response.raw, "item", use_float=True)
+
+
+def fetch_polls(skip: int = 0, limit: int = 10, base_url: str = "http://localhost:8000", client=None, stream: bool = False) -> Union[List[Dict], Iterator[Dict]]:
     """
     Fetch paginated poll data from the /polls endpoint.
     
@@ -12,21 +25,26 @@ def fetch_polls(skip: int = 0, limit: int = 10, base_url: str = "http://localhos
         skip (int): Number of items to skip for pagination (default: 0)
         limit (int): Maximum number of items to return (default: 10)
         base_url (str): The base URL of the API (default: http://localhost:8000)
+        client: requests.Session or httpx.Client to use (default: shared SESSION);
+            stream=True needs a requests.Session
+        stream (bool): Parse the response incrementally and yield polls one at a
+            time instead of loading the whole body (default: False)
     
     Returns:
-        List[Dict]: List of poll objects following the PollOut schema
+        Union[List[Dict], Iterator[Dict]]: Poll objects following the PollOut
+            schema; an iterator when stream is True
         
     Raises:
         requests.exceptions.RequestException: If the request fails
-        ValueError: If the response indicates an error
+        ValueError: If the response indicates an error, or stream=True is used
+            with a client that is not a requests.Session
     """
     url = f"{base_url}/polls"
     
     # Validate parameters
-    if skip < 0:
-        raise ValueError(400,"Skip parameter must be non-negative")
-    if limit <= 0:
-        raise ValueError(400,"Limit parameter must be positive")
+    # One sign test covers both: the OR is negative iff skip < 0 or limit < 1
+    if (skip | (limit - 1)) < 0:
+        raise ValueError("Skip parameter must be non-negative" if skip < 0 else "Limit parameter must be positive")
     
     # Prepare query parameters
     params = {
@@ -34,17 +52,18 @@ def fetch_polls(skip: int = 0, limit: int = 10, base_url: str = "http://localhos
         "limit": limit
     }
     
-    try:
-        # Make the GET request
-        response = requests.get(url, params=params)
-        
-        if response.status_code == 200:
-            return response.json()
-        else:
-            response.raise_for_status()  # Raises an exception for HTTP errors
-            
-    except requests.exceptions.RequestException as e:
-        raise requests.exceptions.RequestException(f"Failed to fetch polls")
+    if stream:
+        if client is not None and not isinstance(client, Session):
+            raise ValueError("stream=True requires a requests.Session client")
+        return _stream_polls(url, params, client)
+    
+    # Make the GET request
+    response = (client or SESSION).get(url, params=params)
+    
+    if response.status_code == 200:
+        return response_json(response)
+    else:
+        response.raise_for_status()  # Raises an exception for HTTP errors
 
 
 if __name__ == "__main__":
@@ -53,16 +72,17 @@ if __name__ == "__main__":
     # Example 2: Fetch polls with simple version
     print("Example 2: Fetch Polls (Simple)")
     try:
-        polls = fetch_polls(skip=0, limit=0)
-        print(f"Fetched {len(polls)} polls:")
-        for poll in polls:
+        count = 0
+        for poll in fetch_polls(skip=0, limit=0, stream=True):
+            count += 1
             print(f"  - Poll {poll['id']}: {poll['question']}")
             print(f"    Created: {poll['created_at']}")
             print(f"    Options: {len(poll['options'])}")
             for option in poll['options']:
                 print(f"      * {option['text']}")
             print()
+        print(f"Fetched {count} polls")
     except ValueError as e:
         print(f"Validation error: {e}")
-    except requests.exceptions.RequestException as e:
+    except RequestException as e:
         print(f"Request failed: {e}")
\ No newline at end of file
@@ -1,51 +1,94 @@
-import requests
+import asyncio
 import json
-from typing import Dict, Optional, Tuple, List
+import socket
+import http.client
+import time
+from typing import Dict, Optional, Tuple, List, Union
+from urllib.parse import urlsplit
 
+from requests.exceptions import HTTPError, RequestException
 
-def get_poll_results(poll_id: int, base_url: str = "http://localhost:8000") -> Dict:
+from _formatting import format_poll_results, summarize_votes
+from _http import (
+    SESSION, CONNECT_ERRORS, JSON_HEADERS, REQUEST_ERRORS, RESULTS_CACHE, RESULTS_LOCK, TIMEOUT_ERRORS,
+    fail_with, http_error, json_dumps, json_loads, ok, response_json, results_url, store_results,
+)
+
+
+_RESULTS_DISPATCH = {
+    200: ok,
+    404: fail_with("Poll not found"),
+}
+
+# Base URLs whose server answered the batch endpoint with 404/405
+_BATCH_UNSUPPORTED = set()
+
+def get_poll_results(poll_id: int, base_url: str = "http://localhost:8000", client=None, ttl: float = 5.0) -> Dict:
     """
     Get poll results from the /polls/{poll_id}/results endpoint.
     
     Args:
         poll_id (int): The ID of the poll to get results for
         base_url (str): The base URL of the API (default: http://localhost:8000)
+        client: requests.Session or httpx.Client to use (default: shared SESSION)
+        ttl (float): Seconds a fetched result is served from cache before it is
+            revalidated with the server (default: 5.0)
     
     Returns:
-        Dict: Poll results following the PollResults schema
+        Dict: Poll results following the PollResults schema; a fresh object on
+            every call, so callers may modify it. vote_on_poll evicts the
+            cached entry of the poll it voted on.
         
     Raises:
         ValueError: If validation fails or response indicates an error
         requests.exceptions.RequestException: If the request fails
     """
-    url = f"{base_url}/polls/{poll_id}/results"
-    
     # Validate parameters
     if not poll_id or poll_id <= 0:
         raise ValueError("Poll ID must be a positive integer")
     
-    try:
-        # Make the GET request
-        response = requests.get(url)
-        
-        if response.status_code == 200:
-            return response.json()
-        elif response.status_code == 404:
-            raise ValueError("Poll not found")
-        else:
-            response.raise_for_status()  # Raises an exception for other HTTP errors
-            
-    except requests.exceptions.RequestException as e:
-        raise requests.exceptions.RequestException(f"Failed to get poll results: {str(e)}")
+    key = (base_url, poll_id)
+    with RESULTS_LOCK:
+        entry = RESULTS_CACHE.get(key)
+    if entry and entry[0] > time.monotonic():
+        return json_loads(entry[1])
+    
+    url = results_url(base_url, poll_id)
+    
+    # Let the server answer 304 if the cached copy is still current
+    headers = {}
+    if entry:
+        if entry[2]:
+            headers["If-None-Match"] = entry[2]
+        if entry[3]:
+            headers["If-Modified-Since"] = entry[3]
+    
+    # Make the GET request
+    response = (client or SESSION).get(url, headers=headers)
+    
+    if response.status_code == 304 and entry:
+        store_results(key, (time.monotonic() + ttl,) + entry[1:])
+        return json_loads(entry[1])
+    
+    # Only the 200 handler returns; the others raise
+    results_data = _RESULTS_DISPATCH.get(response.status_code, http_error)(response)
+    store_results(key, (
+        time.monotonic() + ttl,
+        response.content,
+        response.headers.get("ETag"),
+        response.headers.get("Last-Modified"),
+    ))
+    return results_data
 
 
-def get_poll_results_with_error_handling(poll_id: int, base_url: str = "http://localhost:8000") -> Tuple[bool, Optional[Dict], Optional[str]]:
+def get_poll_results_with_error_handling(poll_id: int, base_url: str = "http://localhost:8000", client=None) -> Tuple[bool, Optional[Dict], Optional[str]]:
     """
     Get poll results with comprehensive error handling.
     
     Args:
         poll_id (int): The ID of the poll to get results for
         base_url (str): The base URL of the API (default: http://localhost:8000)
+        client: requests.Session or httpx.Client to use (default: shared SESSION)
     
     Returns:
         Tuple[bool, Optional[Dict], Optional[str]]: 
@@ -53,36 +96,37 @@ def get_poll_results_with_error_handling(poll_id: int, base_url: str = "http://l
             - results_data (Optional[Dict]): Poll results if successful, None otherwise
             - error_message (Optional[str]): Error message if failed, None otherwise
     """
-    url = f"{base_url}/polls/{poll_id}/results"
-    
     # Validate parameters
     if not poll_id or poll_id <= 0:
         return False, None, "Poll ID must be a positive integer"
     
+    url = results_url(base_url, poll_id)
+    
     try:
         # Make the GET request
-        response = requests.get(url)
+        response = (client or SESSION).get(url)
         
         if response.status_code == 200:
-            results_data = response.json()
+            results_data = response_json(response)
             return True, results_data, None
         elif response.status_code == 404:
             return False, None, "Poll not found"
         else:
-            error_message = f"HTTP {response.status_code}: {response.reason}"
+            # Parse the error body once; fall back to the status line
             try:
-                error_detail = response.json()
-                if isinstance(error_detail, dict) and "detail" in error_detail:
-                    error_message = error_detail["detail"]
-            except:
-                pass
-            return False, None, error_message
+                error_detail = json_loads(response.content)
+            except ValueError:
+                error_detail = None
+            if isinstance(error_detail, dict) and "detail" in error_detail:
+                return False, None, error_detail["detail"]
+            reason = getattr(response, "reason", None) or getattr(response, "reason_phrase", "")
+            return False, None, f"HTTP {response.status_code}: {reason}"
             
-    except requests.exceptions.ConnectionError:
+    except CONNECT_ERRORS:
         return False, None, "Connection error: Could not connect to the server"
-    except requests.exceptions.Timeout:
+    except TIMEOUT_ERRORS:
         return False, None, "Request timeout: Server took too long to respond"
-    except requests.exceptions.RequestException as e:
+    except REQUEST_ERRORS as e:
         return False, None, f"Request error: {str(e)}"
     except json.JSONDecodeError:
         return False, None, "Invalid JSON response from server"
@@ -90,56 +134,177 @@ def get_poll_results_with_error_handling(poll_id: int, base_url: str = "http://l
         return False, None, f"Unexpected error: {str(e)}"
 
 
-def format_poll_results(results_data: Dict) -> str:
+class _SharedReader:
+    """Hands one buffered reader to every HTTPResponse on a pipelined socket."""
+
+    def __init__(self, fp):
+        self._fp = fp
+
+    def makefile(self, mode):
+        return self
+
+    def __getattr__(self, name):
+        return getattr(self._fp, name)
+
+    def close(self):
+        # HTTPResponse closes its file once the body is read; keep the
+        # reader open for the responses still queued behind it.
+        pass
+
+
+def _get_results_or_error(poll_id: int, base_url: str, client=None) -> Union[Dict, Exception]:
+    try:
+        return get_poll_results(poll_id, base_url, client)
+    except (ValueError,) + REQUEST_ERRORS as e:
+        return e
+
+
+def fetch_results_pipelined(poll_ids: List[int], base_url: str = "http://localhost:8000") -> List[Union[Dict, Exception]]:
     """
-    Helper function to format poll results in a readable way.
+    Fetch results for several polls over one connection using HTTP/1.1 pipelining.
+    
+    All GET requests are written back-to-back before any response is read, and
+    responses are matched to poll IDs by position. If the server closes the
+    connection mid-batch, the remaining polls are fetched sequentially.
     
     Args:
-        results_data (Dict): Poll results data from the API
-        
+        poll_ids (List[int]): IDs of the polls to get results for
+        base_url (str): The base URL of the API (default: http://localhost:8000)
+    
     Returns:
-        str: Formatted string representation of the results
+        List[Union[Dict, Exception]]: One entry per poll ID, in the same order;
+            failed lookups are returned as the raised exception
+        
+    Raises:
+        ValueError: If any poll ID is not a positive integer
     """
-    if not results_data:
-        return "No results data available"
+    # Validate parameters
+    if any(not poll_id or poll_id <= 0 for poll_id in poll_ids):
+        raise ValueError("Poll ID must be a positive integer")
     
-    poll_id = results_data.get("poll_id", "Unknown")
-    question = results_data.get("question", "Unknown question")
-    results = results_data.get("results", [])
+    parts = urlsplit(base_url)
+    if parts.scheme != "http" or not poll_ids:
+        return [_get_results_or_error(poll_id, base_url) for poll_id in poll_ids]
     
-    output = f"Poll #{poll_id}: {question}\n"
-    output += "=" * (len(output) - 1) + "\n\n"
+    host = parts.hostname
+    prefix = parts.path.rstrip("/")
+    request_bytes = b"".join(
+        f"GET {prefix}/polls/{poll_id}/results HTTP/1.1\r\n"
+        f"Host: {parts.netloc}\r\n"
+        f"Accept: application/json\r\n\r\n".encode("ascii")
+        for poll_id in poll_ids
+    )
     
-    if not results:
-        output += "No votes cast yet.\n"
-        return output
+    results: List[Union[Dict, Exception]] = []
+    try:
+        with socket.create_connection((host, parts.port or 80), timeout=10) as sock:
+            sock.sendall(request_bytes)
+            with sock.makefile("rb") as fp:
+                reader = _SharedReader(fp)
+                for poll_id in poll_ids:
+                    response = http.client.HTTPResponse(reader, method="GET")  # type: ignore[arg-type]
+                    response.begin()
+                    body = response.read()
+                    if response.status == 200:
+                        try:
+                            results.append(json_loads(body))
+                        except ValueError as e:
+                            results.append(e)
+                    elif response.status == 404:
+                        results.append(ValueError("Poll not found"))
+                    else:
+                        results.append(HTTPError(f"HTTP {response.status}: {response.reason}"))
+                    if response.will_close:
+                        break
+    except (OSError, http.client.HTTPException):
+        pass
     
-    # Sort results by vote count (descending)
-    sorted_results = sorted(results, key=lambda x: x.get("vote_count", 0), reverse=True)
+    # Server refused or dropped the pipelined connection: finish sequentially
+    for poll_id in poll_ids[len(results):]:
+        results.append(_get_results_or_error(poll_id, base_url))
+    return results
+
+
+def _parse_batch(response, poll_ids: List[int]) -> Optional[List[Union[Dict, Exception]]]:
+    """Validate a batch reply: one entry per requested ID, in request order."""
+    try:
+        batch = json_loads(response.content)
+    except ValueError:
+        return None
+    if not isinstance(batch, list) or len(batch) != len(poll_ids):
+        return None
+    results: List[Union[Dict, Exception]] = []
+    for poll_id, entry in zip(poll_ids, batch):
+        if entry is None:
+            results.append(ValueError("Poll not found"))
+        elif isinstance(entry, dict) and entry.get("poll_id") == poll_id:
+            results.append(entry)
+        else:
+            return None
+    return results
+
+
+def _event_loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def get_many_poll_results(poll_ids: List[int], base_url: str = "http://localhost:8000", client=None) -> List[Union[Dict, Exception]]:
+    """
+    Get results for several polls in a single round trip.
     
-    total_votes = sum(result.get("vote_count", 0) for result in sorted_results)
-    output += f"Total votes: {total_votes}\n\n"
+    POSTs the IDs to the /polls/results:batch endpoint. Servers without that
+    endpoint are remembered per base URL. When the batch call is unavailable or
+    its reply is malformed, results are fetched per poll: concurrently through
+    the async client for plain http(s) URLs without a custom client and outside
+    a running event loop, otherwise sequentially through `client`/SESSION.
     
-    for i, result in enumerate(sorted_results, 1):
-        option_id = result.get("option_id", "Unknown")
-        text = result.get("text", "Unknown option")
-        vote_count = result.get("vote_count", 0)
-        
-        percentage = (vote_count / total_votes * 100) if total_votes > 0 else 0
-        output += f"{i}. {text}\n"
-        output += f"   Votes: {vote_count} ({percentage:.1f}%)\n"
-        output += f"   Option ID: {option_id}\n\n"
+    Args:
+        poll_ids (List[int]): IDs of the polls to get results for
+        base_url (str): The base URL of the API (default: http://localhost:8000)
+        client: requests.Session or httpx.Client to use (default: shared SESSION)
+    
+    Returns:
+        List[Union[Dict, Exception]]: One entry per poll ID, in the same order;
+            failed lookups are returned as the raised exception
+    """
+    if not poll_ids:
+        return []
+    
+    if base_url not in _BATCH_UNSUPPORTED:
+        try:
+            response = (client or SESSION).post(
+                f"{base_url}/polls/results:batch",
+                data=json_dumps({"poll_ids": poll_ids}),
+                headers=JSON_HEADERS,
+            )
+        except REQUEST_ERRORS:
+            response = None
+        if response is not None:
+            if response.status_code in (404, 405):
+                _BATCH_UNSUPPORTED.add(base_url)
+            elif response.status_code == 200:
+                results = _parse_batch(response, poll_ids)
+                if results is not None:
+                    return results
     
-    return output
+    if client is None and urlsplit(base_url).scheme in ("http", "https") and not _event_loop_running():
+        from async_client import fetch_many_results
+        return asyncio.run(fetch_many_results(poll_ids, base_url))
+    return [_get_results_or_error(poll_id, base_url, client) for poll_id in poll_ids]
 
 
-def get_poll_results_summary(poll_id: int, base_url: str = "http://localhost:8000") -> str:
+def get_poll_results_summary(poll_id: int, base_url: str = "http://localhost:8000", client=None) -> str:
     """
     Get poll results and return a formatted summary.
     
     Args:
         poll_id (int): The ID of the poll to get results for
         base_url (str): The base URL of the API (default: http://localhost:8000)
+        client: requests.Session or httpx.Client to use (default: shared SESSION)
     
     Returns:
         str: Formatted summary of poll results
@@ -148,7 +313,7 @@ def get_poll_results_summary(poll_id: int, base_url: str = "http://localhost:800
         ValueError: If poll not found or validation fails
         requests.exceptions.RequestException: If the request fails
     """
-    results_data = get_poll_results(poll_id, base_url)
+    results_data = get_poll_results(poll_id, base_url, client)
     return format_poll_results(results_data)
 
 
@@ -167,7 +332,7 @@ if __name__ == "__main__":
         
     except ValueError as e:
         print(f"Error: {e}")
-    except requests.exceptions.RequestException as e:
+    except RequestException as e:
         print(f"Request failed: {e}")
     
     print("\n" + "="*60 + "\n")
@@ -183,12 +348,12 @@ if __name__ == "__main__":
         # Show some statistics
         if results_data and "results" in results_data:
             results_list = results_data["results"]
-            total_votes = sum(r.get("vote_count", 0) for r in results_list)
-            most_popular = max(results_list, key=lambda x: x.get("vote_count", 0))
+            total_votes, most_popular = summarize_votes(results_list)
             
             print(f"Statistics:")
             print(f"- Total votes cast: {total_votes}")
-            print(f"- Most popular option: {most_popular.get('text', 'Unknown')} ({most_popular.get('vote_count', 0)} votes)")
+            if most_popular is not None:
+                print(f"- Most popular option: {most_popular.get('text', 'Unknown')} ({most_popular.get('vote_count', 0)} votes)")
             print(f"- Number of options: {len(results_list)}")
     else:
         print(f"Failed to get poll results: {error}")
@@ -202,7 +367,7 @@ if __name__ == "__main__":
         print(summary)
     except ValueError as e:
         print(f"Error: {e}")
-    except requests.exceptions.RequestException as e:
+    except RequestException as e:
         print(f"Request failed: {e}")
     
     print("\n" + "="*60 + "\n")
@@ -226,17 +391,17 @@ if __name__ == "__main__":
     # Example 5: Compare multiple polls
     print("Example 5: Compare Multiple Polls")
     poll_ids = [1, 2, 3]
+    all_results = get_many_poll_results(poll_ids)
     
-    for poll_id in poll_ids:
+    for poll_id, results_data in zip(poll_ids, all_results):
         print(f"--- Poll {poll_id} ---")
-        success, results_data, error = get_poll_results_with_error_handling(poll_id=poll_id)
         
-        if success:
+        if not isinstance(results_data, Exception):
             question = results_data.get("question", "Unknown")
             total_votes = sum(r.get("vote_count", 0) for r in results_data.get("results", []))
             print(f"Question: {question}")
             print(f"Total votes: {total_votes}")
             print()
         else:
-            print(f"Error: {error}")
+            print(f"Error: {results_data}")
             print()
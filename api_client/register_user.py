@@ -1,10 +1,20 @@
-import requests
 import json
 from typing import Dict, Optional, Tuple, List
 from datetime import datetime
 
+from requests.exceptions import RequestException
 
-def register_user(username: str, password: str, base_url: str = "http://localhost:8000") -> Dict:
+from _http import SESSION, JSON_HEADERS, fail_with, http_error, json_dumps, ok
+
+
+_REGISTER_DISPATCH = {
+    200: ok,
+    201: ok,
+    400: fail_with("Username already registered"),
+}
+
+
+def register_user(username: str, password: str, base_url: str = "http://localhost:8000", client=None) -> Dict:
     """
     Simple version of register_user that raises exceptions on failure.
     
@@ -12,6 +22,7 @@ def register_user(username: str, password: str, base_url: str = "http://localhos
         username (str): The username for the new user
         password (str): The password for the new user
         base_url (str): The base URL of the API (default: http://localhost:8000)
+        client: requests.Session or httpx.Client to use (default: shared SESSION)
     
     Returns:
         Dict: User data on successful registration
@@ -22,20 +33,12 @@ def register_user(username: str, password: str, base_url: str = "http://localhos
     """
     url = f"{base_url}/register"
     if not username or not password:
-        raise ValueError(400,"Username and password are required")
+        raise ValueError("Username and password are required")
     payload = {"username": username, "password": password}
-    headers = {
-        "Content-Type": "application/json"
-    }
     
-    response = requests.post(url, json=payload, headers=headers)
+    response = (client or SESSION).post(url, data=json_dumps(payload), headers=JSON_HEADERS)
     
-    if response.status_code == 200:
-        return response.json()
-    elif response.status_code == 400:
-        raise ValueError(400,"Username already registered")
-    else:
-        response.raise_for_status()  # Raises an exception for other HTTP errors
+    return _REGISTER_DISPATCH.get(response.status_code, http_error)(response)
 
 
 
@@ -50,5 +53,5 @@ if __name__ == "__main__":
         print(f"Registration successful! User ID: {user_data['id']}, Username: {user_data['username']}")
     except ValueError as e:
         print(f"Registration failed: {e}")
-    except requests.exceptions.RequestException as e:
+    except RequestException as e:
         print(f"Request failed: {e}")
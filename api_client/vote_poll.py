@@ -1,9 +1,35 @@
-import requests
+import base64
+import hashlib
 import json
+import threading
+import time
 from typing import Dict, Optional, Tuple
 
+from requests.exceptions import RequestException
 
-def vote_on_poll(poll_id: int, option_id: int, access_token: str, base_url: str = "http://localhost:8000") -> Dict:
+from _http import SESSION, JSON_HEADERS, evict_results, fail_with, http_error, json_dumps, json_loads, ok, vote_url
+
+
+_VOTE_DISPATCH = {
+    200: ok,
+    401: fail_with("Unauthorized: Invalid or expired access token"),
+    404: fail_with("Poll or option not found"),
+}
+
+_LOGIN_DISPATCH = {
+    200: ok,
+    400: fail_with("Incorrect username or password"),
+}
+
+# Tokens are reused until this many seconds before their `exp` claim
+_TOKEN_EXPIRY_MARGIN = 30
+
+# (base_url, username, password digest) -> (exp, access_token)
+_TOKEN_CACHE: Dict[Tuple[str, str, str], Tuple[float, str]] = {}
+_TOKEN_LOCK = threading.Lock()
+
+
+def vote_on_poll(poll_id: int, option_id: int, access_token: str, base_url: str = "http://localhost:8000", client=None) -> Dict:
     """
     Cast a vote on an existing poll via the /polls/{poll_id}/vote endpoint.
     
@@ -12,6 +38,7 @@ def vote_on_poll(poll_id: int, option_id: int, access_token: str, base_url: str
         option_id (int): The ID of the option to vote for
         access_token (str): JWT access token for authentication
         base_url (str): The base URL of the API (default: http://localhost:8000)
+        client: requests.Session or httpx.Client to use (default: shared SESSION)
     
     Returns:
         Dict: Vote data following the VoteOut schema
@@ -20,46 +47,37 @@ def vote_on_poll(poll_id: int, option_id: int, access_token: str, base_url: str
         ValueError: If validation fails or response indicates an error
         requests.exceptions.RequestException: If the request fails
     """
-    url = f"{base_url}/polls/{poll_id}/vote"
-    
     # Validate parameters
-    if not poll_id or poll_id <= 0:
-        raise ValueError("Poll ID must be a positive integer")
-    if not option_id or option_id <= 0:
-        raise ValueError("Option ID must be a positive integer")
+    # `not x` first so None/0 get a ValueError before the combined sign test
+    if not poll_id or not option_id or ((poll_id - 1) | (option_id - 1)) < 0:
+        raise ValueError("Poll ID must be a positive integer" if not poll_id or poll_id < 1 else "Option ID must be a positive integer")
     if not access_token:
         raise ValueError("Access token is required for voting")
     
-    # Prepare the request payload
-    payload = {
-        "option_id": option_id
-    }
-    
     # Set headers with authentication
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {access_token}"
-    }
+    headers = dict(JSON_HEADERS, Authorization=f"Bearer {access_token}")
     
-    try:
-        # Make the POST request
-        response = requests.post(url, json=payload, headers=headers)
-        
-        if response.status_code == 200:
-            return response.json()
-        elif response.status_code == 401:
-            raise ValueError("Unauthorized: Invalid or expired access token")
-        elif response.status_code == 404:
-            raise ValueError("Poll or option not found")
-        else:
-            response.raise_for_status()  # Raises an exception for other HTTP errors
-            
-    except requests.exceptions.RequestException as e:
-        raise requests.exceptions.RequestException(f"Failed to vote on poll: {str(e)}")
+    # Make the POST request
+    response = (client or SESSION).post(vote_url(base_url, poll_id), data=json_dumps({"option_id": option_id}), headers=headers)
+    
+    vote_data = _VOTE_DISPATCH.get(response.status_code, http_error)(response)
+    # The poll's cached results no longer include this vote
+    evict_results(base_url, poll_id)
+    return vote_data
 
 
 
-def login_and_get_token(username: str, password: str, base_url: str = "http://localhost:8000") -> str:
+def _token_expiry(token: str) -> Optional[float]:
+    """Read the `exp` claim from a JWT without verifying it."""
+    try:
+        payload = token.split(".")[1]
+        claims = json_loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def login_and_get_token(username: str, password: str, base_url: str = "http://localhost:8000", client=None) -> str:
     """
     Helper function to login and get an access token for voting.
     
@@ -67,14 +85,22 @@ def login_and_get_token(username: str, password: str, base_url: str = "http://lo
         username (str): The username for login
         password (str): The password for login
         base_url (str): The base URL of the API (default: http://localhost:8000)
+        client: requests.Session or httpx.Client to use (default: shared SESSION)
     
     Returns:
-        str: Access token for authentication
+        str: Access token for authentication; a cached token is returned while
+            it is more than 30 seconds from expiry
         
     Raises:
         ValueError: If login fails
         requests.exceptions.RequestException: If the request fails
     """
+    key = (base_url, username, hashlib.sha256(password.encode("utf-8")).hexdigest())
+    with _TOKEN_LOCK:
+        entry = _TOKEN_CACHE.get(key)
+    if entry and entry[0] - _TOKEN_EXPIRY_MARGIN > time.time():
+        return entry[1]
+    
     url = f"{base_url}/login"
     
     # Prepare form data for login (as per OpenAPI spec)
@@ -83,20 +109,17 @@ def login_and_get_token(username: str, password: str, base_url: str = "http://lo
         "password": password
     }
     
-    try:
-        # Make the POST request with form data
-        response = requests.post(url, data=form_data)
-        
-        if response.status_code == 200:
-            token_data = response.json()
-            return token_data["access_token"]
-        elif response.status_code == 400:
-            raise ValueError("Incorrect username or password")
-        else:
-            response.raise_for_status()  # Raises an exception for other HTTP errors
-            
-    except requests.exceptions.RequestException as e:
-        raise requests.exceptions.RequestException(f"Failed to login: {str(e)}")
+    # Make the POST request with form data
+    response = (client or SESSION).post(url, data=form_data)
+    
+    token_data = _LOGIN_DISPATCH.get(response.status_code, http_error)(response)
+    access_token = token_data["access_token"]
+    
+    expires_at = _token_expiry(access_token)
+    if expires_at is not None:
+        with _TOKEN_LOCK:
+            _TOKEN_CACHE[key] = (expires_at, access_token)
+    return access_token
 
 
 # Example usage
@@ -118,7 +141,7 @@ if __name__ == "__main__":
         
     except ValueError as e:
         print(f"Error: {e}")
-    except requests.exceptions.RequestException as e:
+    except RequestException as e:
         print(f"Request failed: {e}")
     
     print("\n" + "="*50 + "\n")
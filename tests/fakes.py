@@ -0,0 +1,56 @@
+import json
+import threading
+from contextlib import contextmanager
+from http.server import ThreadingHTTPServer
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response / httpx.Response."""
+
+    def __init__(self, status_code=200, body=None, headers=None, reason="", url=""):
+        self.status_code = status_code
+        if body is None:
+            body = b""
+        elif not isinstance(body, bytes):
+            body = json.dumps(body).encode("utf-8")
+        self.content = body
+        self.headers = headers or {}
+        self.reason = reason
+        self.url = url
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class FakeClient:
+    """Replays queued responses (or raises queued exceptions) and records each call."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        return self._next("GET", url, kwargs)
+
+    def post(self, url, **kwargs):
+        return self._next("POST", url, kwargs)
+
+    def _next(self, method, url, kwargs):
+        self.calls.append((method, url, kwargs))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@contextmanager
+def run_server(handler_class):
+    """Serve `handler_class` on a free localhost port and yield its base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,67 @@
+import gzip
+import json
+import os
+import sys
+from http.server import BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "api_client")))
+import pytest
+from requests.exceptions import HTTPError
+import fetch_polls as fp
+from fakes import FakeClient, FakeResponse, run_server
+
+
+def test_fetch_polls_with_custom_client():
+    client = FakeClient(FakeResponse(200, [{"id": 1}]))
+    assert fp.fetch_polls(base_url="http://polly.test", client=client) == [{"id": 1}]
+    assert client.calls[0][2]["params"] == {"skip": 0, "limit": 10}
+
+
+def test_stream_requires_requests_session():
+    with pytest.raises(ValueError, match="requires a requests.Session"):
+        fp.fetch_polls(base_url="http://polly.test", client=FakeClient(), stream=True)
+
+
+POLLS = [
+    {"id": i, "question": f"Q{i}", "created_at": "2024-01-01T00:00:00", "options": [{"id": 1, "text": "A"}]}
+    for i in range(1, 4)
+]
+
+
+class _PollsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.startswith("/broken"):
+            status, body, headers = 500, b'{"detail": "boom"}', {}
+        else:
+            # gzip the body so the test also covers decode_content
+            status, body, headers = 200, gzip.compress(json.dumps(POLLS).encode()), {"Content-Encoding": "gzip"}
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def polls_server():
+    with run_server(_PollsHandler) as base_url:
+        yield base_url
+
+
+def test_stream_yields_parsed_polls(polls_server):
+    polls = fp.fetch_polls(base_url=polls_server, stream=True)
+    assert not isinstance(polls, list)
+    assert list(polls) == POLLS
+
+
+def test_stream_http_error_raises_from_generator(polls_server):
+    polls = fp.fetch_polls(base_url=f"{polls_server}/broken", stream=True)
+    with pytest.raises(HTTPError):
+        next(polls)
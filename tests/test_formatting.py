@@ -0,0 +1,61 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "api_client")))
+import pytest
+import _formatting
+
+
+def _poll(option_count):
+    # Few distinct counts so many options tie and the sort order matters
+    results = [
+        {"option_id": i, "text": f"Option {i}", "vote_count": (i * 7) % 5}
+        for i in range(1, option_count + 1)
+    ]
+    return {"poll_id": 1, "question": "Q", "results": results}
+
+
+def test_numpy_and_python_paths_format_identically(monkeypatch):
+    pytest.importorskip("numpy")
+    poll = _poll(300)
+    assert len(poll["results"]) >= _formatting._NUMPY_MIN_OPTIONS
+    with_numpy = _formatting.format_poll_results(poll)
+    monkeypatch.setattr(_formatting, "np", None)
+    assert _formatting.format_poll_results(poll) == with_numpy
+
+
+def test_ties_keep_input_order():
+    output = _formatting.format_poll_results({
+        "poll_id": 2,
+        "question": "Tie?",
+        "results": [
+            {"option_id": 1, "text": "first", "vote_count": 1},
+            {"option_id": 2, "text": "second", "vote_count": 4},
+            {"option_id": 3, "text": "third", "vote_count": 4},
+        ],
+    })
+    assert output.index("1. second") < output.index("2. third") < output.index("3. first")
+    assert "Total votes: 9" in output
+
+
+def test_format_without_results():
+    assert _formatting.format_poll_results({}) == "No results data available"
+    output = _formatting.format_poll_results({"poll_id": 3, "question": "Empty", "results": []})
+    assert output == "Poll #3: Empty\n==============\n\nNo votes cast yet.\n"
+
+
+def test_summarize_votes():
+    results = [
+        {"text": "a", "vote_count": 2},
+        {"text": "b", "vote_count": None},
+        {"text": "c", "vote_count": 5},
+        {"text": "d", "vote_count": 5},
+        {"text": "e"},
+    ]
+    total, most_popular = _formatting.summarize_votes(results)
+    assert total == 12
+    assert most_popular is results[2]
+
+
+def test_summarize_votes_empty():
+    assert _formatting.summarize_votes([]) == (0, None)
@@ -0,0 +1,245 @@
+import asyncio
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "api_client")))
+import httpx
+import pytest
+import _http
+import get_poll_results as gpr
+import vote_poll
+from fakes import FakeClient, FakeResponse, run_server
+
+
+BASE_URL = "http://polly.test"
+RESULTS = {"poll_id": 1, "question": "Q", "results": [{"option_id": 1, "text": "A", "vote_count": 2}]}
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    _http.RESULTS_CACHE.clear()
+    gpr._BATCH_UNSUPPORTED.clear()
+    yield
+
+
+def test_error_handling_maps_httpx_connect_error():
+    client = FakeClient(httpx.ConnectError("refused"))
+    success, data, error = gpr.get_poll_results_with_error_handling(1, BASE_URL, client)
+    assert (success, data) == (False, None)
+    assert error == "Connection error: Could not connect to the server"
+
+
+def test_error_handling_maps_httpx_timeout():
+    client = FakeClient(httpx.ReadTimeout("slow"))
+    _, _, error = gpr.get_poll_results_with_error_handling(1, BASE_URL, client)
+    assert error == "Request timeout: Server took too long to respond"
+
+
+def test_cache_hit_skips_the_network():
+    client = FakeClient(FakeResponse(200, RESULTS))
+    assert gpr.get_poll_results(1, BASE_URL, client) == RESULTS
+    assert gpr.get_poll_results(1, BASE_URL, client) == RESULTS
+    assert len(client.calls) == 1
+
+
+def test_cached_results_are_copies():
+    client = FakeClient(FakeResponse(200, RESULTS))
+    gpr.get_poll_results(1, BASE_URL, client)["results"].append({"option_id": 9})
+    assert gpr.get_poll_results(1, BASE_URL, client) == RESULTS
+
+
+def test_expired_entry_is_refetched():
+    client = FakeClient(FakeResponse(200, RESULTS), FakeResponse(200, dict(RESULTS, question="New")))
+    gpr.get_poll_results(1, BASE_URL, client, ttl=0)
+    assert gpr.get_poll_results(1, BASE_URL, client)["question"] == "New"
+    assert len(client.calls) == 2
+
+
+def test_not_modified_reuses_cached_body():
+    client = FakeClient(
+        FakeResponse(200, RESULTS, headers={"ETag": '"v1"', "Last-Modified": "Mon"}),
+        FakeResponse(304),
+    )
+    gpr.get_poll_results(1, BASE_URL, client, ttl=0)
+    assert gpr.get_poll_results(1, BASE_URL, client) == RESULTS
+    assert client.calls[1][2]["headers"] == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon"}
+    # The 304 refreshed the entry, so this is served from cache
+    gpr.get_poll_results(1, BASE_URL, client)
+    assert len(client.calls) == 2
+
+
+def test_vote_evicts_cached_results():
+    client = FakeClient(
+        FakeResponse(200, RESULTS),
+        FakeResponse(200, {"id": 1, "user_id": 1, "option_id": 1, "created_at": "now"}),
+        FakeResponse(200, dict(RESULTS, results=[{"option_id": 1, "text": "A", "vote_count": 3}])),
+    )
+    gpr.get_poll_results(1, BASE_URL, client)
+    vote_poll.vote_on_poll(1, 1, "token", BASE_URL, client)
+    assert gpr.get_poll_results(1, BASE_URL, client)["results"][0]["vote_count"] == 3
+
+
+def test_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(_http, "RESULTS_CACHE_MAX", 2)
+    client = FakeClient(*(FakeResponse(200, dict(RESULTS, poll_id=i)) for i in (1, 2, 3)))
+    for poll_id in (1, 2, 3):
+        gpr.get_poll_results(poll_id, BASE_URL, client)
+    assert list(_http.RESULTS_CACHE) == [(BASE_URL, 2), (BASE_URL, 3)]
+
+
+class _AlwaysClient:
+    """Thread-safe fake that answers every GET with the same results."""
+
+    def get(self, url, **kwargs):
+        return FakeResponse(200, RESULTS)
+
+
+def test_cache_survives_concurrent_fill_and_evict(monkeypatch):
+    monkeypatch.setattr(_http, "RESULTS_CACHE_MAX", 64)
+    # Switch threads as often as possible to expose unlocked dict iteration
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    client = _AlwaysClient()
+    errors = []
+
+    def worker(offset):
+        try:
+            for i in range(2000):
+                poll_id = (i + offset) % 200 + 1
+                gpr.get_poll_results(poll_id, BASE_URL, client, ttl=60 if i % 2 else 0)
+                _http.evict_results(BASE_URL, (poll_id + 7) % 200 + 1)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n * 6,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    try:
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert errors == []
+    assert len(_http.RESULTS_CACHE) <= 64
+
+
+def test_batch_reply_is_returned_in_order():
+    client = FakeClient(FakeResponse(200, [dict(RESULTS, poll_id=2), None, RESULTS]))
+    results = gpr.get_many_poll_results([2, 5, 1], BASE_URL, client)
+    assert results[0]["poll_id"] == 2
+    assert isinstance(results[1], ValueError)
+    assert results[2] == RESULTS
+    assert client.calls[0][:2] == ("POST", f"{BASE_URL}/polls/results:batch")
+
+
+def test_malformed_batch_reply_falls_back_per_poll():
+    # Reply is out of order, so each poll is fetched through the client instead
+    client = FakeClient(
+        FakeResponse(200, [RESULTS, dict(RESULTS, poll_id=2)]),
+        FakeResponse(200, dict(RESULTS, poll_id=2)),
+        FakeResponse(404),
+    )
+    results = gpr.get_many_poll_results([2, 1], BASE_URL, client)
+    assert results[0]["poll_id"] == 2
+    assert isinstance(results[1], ValueError)
+    assert BASE_URL not in gpr._BATCH_UNSUPPORTED
+
+
+def test_unsupported_batch_endpoint_is_remembered():
+    client = FakeClient(
+        FakeResponse(405),
+        FakeResponse(200, RESULTS),
+        FakeResponse(200, dict(RESULTS, poll_id=2)),
+    )
+    assert gpr.get_many_poll_results([1], BASE_URL, client) == [RESULTS]
+    assert BASE_URL in gpr._BATCH_UNSUPPORTED
+    assert gpr.get_many_poll_results([2], BASE_URL, client)[0]["poll_id"] == 2
+    assert [method for method, _, _ in client.calls] == ["POST", "GET", "GET"]
+
+
+def test_batch_fallback_inside_running_event_loop(monkeypatch):
+    session = FakeClient(FakeResponse(404), FakeResponse(200, RESULTS))
+    monkeypatch.setattr(gpr, "SESSION", session)
+
+    async def caller():
+        return gpr.get_many_poll_results([1], BASE_URL)
+
+    assert asyncio.run(caller()) == [RESULTS]
+
+
+def test_batch_fallback_uses_session_for_unix_socket_urls(monkeypatch):
+    base_url = "http+unix://%2Ftmp%2Fpolly.sock"
+    session = FakeClient(FakeResponse(404), FakeResponse(200, RESULTS))
+    monkeypatch.setattr(gpr, "SESSION", session)
+    assert gpr.get_many_poll_results([1], base_url) == [RESULTS]
+    assert session.calls[1][1] == f"{base_url}/polls/1/results"
+
+
+class _PollHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Poll IDs whose response carries Connection: close
+    close_after = set()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        poll_id = int(self.path.split("/")[2])
+        if poll_id == 404:
+            status, body = 404, b'{"detail": "Poll not found"}'
+        elif poll_id == 500:
+            status, body = 200, b"not json"
+        else:
+            status, body = 200, json.dumps(dict(RESULTS, poll_id=poll_id)).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if poll_id in self.close_after:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def stub_server():
+    with run_server(_PollHandler) as base_url:
+        yield base_url
+    _PollHandler.close_after = set()
+
+
+def test_pipelined_results_match_request_order(stub_server):
+    results = gpr.fetch_results_pipelined([3, 404, 1], stub_server)
+    assert results[0]["poll_id"] == 3
+    assert isinstance(results[1], ValueError) and str(results[1]) == "Poll not found"
+    assert results[2]["poll_id"] == 1
+
+
+def test_pipelined_decode_error_is_returned_per_entry(stub_server):
+    results = gpr.fetch_results_pipelined([500, 2], stub_server)
+    assert isinstance(results[0], ValueError)
+    assert results[1]["poll_id"] == 2
+
+
+def test_pipelined_falls_back_when_server_closes_mid_batch(stub_server):
+    _PollHandler.close_after = {1}
+    results = gpr.fetch_results_pipelined([1, 2, 3], stub_server)
+    assert [result["poll_id"] for result in results] == [1, 2, 3]
+    # Polls after the close were fetched sequentially and cached on the way
+    assert (stub_server, 2) in _http.RESULTS_CACHE
+
+
+@pytest.mark.parametrize("poll_ids", [[0], [1, -1]])
+def test_pipelined_rejects_invalid_poll_ids(poll_ids):
+    with pytest.raises(ValueError, match="positive integer"):
+        gpr.fetch_results_pipelined(poll_ids, BASE_URL)
+
+
+def test_batch_fallback_fetches_concurrently_over_http(stub_server):
+    # The stub has no batch endpoint (501), so the async client is used
+    results = gpr.get_many_poll_results([2, 404], stub_server)
+    assert results[0]["poll_id"] == 2
+    assert isinstance(results[1], ValueError)
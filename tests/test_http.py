@@ -0,0 +1,63 @@
+import os
+import sys
+from http.server import BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "api_client")))
+import pytest
+import _http
+from fakes import run_server
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    """Answers 503 to the first request of each method, then 200."""
+
+    protocol_version = "HTTP/1.1"
+    hits = {}
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self):
+        count = self.hits[self.command] = self.hits.get(self.command, 0) + 1
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        status = 503 if count == 1 else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    do_GET = do_POST = _reply
+
+
+@pytest.fixture
+def flaky_server():
+    _FlakyHandler.hits = {}
+    with run_server(_FlakyHandler) as base_url:
+        yield base_url
+
+
+def test_session_retry_config():
+    retry = _http.SESSION.get_adapter("http://polly.test").max_retries
+    assert retry.total == 3
+    assert set(retry.status_forcelist) == {502, 503, 504}
+    assert "POST" not in retry.allowed_methods
+    assert retry.raise_on_status is False
+
+
+def test_get_is_retried_on_503(flaky_server):
+    response = _http.SESSION.get(f"{flaky_server}/polls")
+    assert response.status_code == 200
+    assert _FlakyHandler.hits["GET"] == 2
+
+
+def test_post_is_not_retried_on_503(flaky_server):
+    response = _http.SESSION.post(f"{flaky_server}/polls/1/vote", data=b"{}")
+    assert response.status_code == 503
+    assert _FlakyHandler.hits["POST"] == 1
+
+
+def test_session_keeps_default_accept_encoding():
+    from requests.utils import DEFAULT_ACCEPT_ENCODING
+
+    assert _http.SESSION.headers["Accept-Encoding"] == DEFAULT_ACCEPT_ENCODING
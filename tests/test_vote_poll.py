@@ -0,0 +1,74 @@
+import base64
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "api_client")))
+import pytest
+import vote_poll
+from fakes import FakeClient, FakeResponse
+
+
+BASE_URL = "http://polly.test"
+
+
+def _jwt(exp):
+    payload = base64.urlsafe_b64encode(json.dumps({"sub": "alice", "exp": exp}).encode()).rstrip(b"=")
+    return f"header.{payload.decode()}.signature"
+
+
+def _login_response(token):
+    return FakeResponse(200, {"access_token": token, "token_type": "bearer"})
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    vote_poll._TOKEN_CACHE.clear()
+    yield
+
+
+@pytest.mark.parametrize(
+    "poll_id, option_id, message",
+    [
+        (None, 1, "Poll ID"),
+        (0, 1, "Poll ID"),
+        (-2, 1, "Poll ID"),
+        (1, None, "Option ID"),
+        (1, 0, "Option ID"),
+    ],
+)
+def test_vote_rejects_invalid_ids(poll_id, option_id, message):
+    with pytest.raises(ValueError, match=message):
+        vote_poll.vote_on_poll(poll_id, option_id, "token", BASE_URL, FakeClient())
+
+
+def test_login_token_is_cached():
+    token = _jwt(time.time() + 3600)
+    client = FakeClient(_login_response(token))
+    assert vote_poll.login_and_get_token("alice", "pw", BASE_URL, client) == token
+    assert vote_poll.login_and_get_token("alice", "pw", BASE_URL, client) == token
+    assert len(client.calls) == 1
+
+
+def test_wrong_password_is_not_served_from_cache():
+    client = FakeClient(_login_response(_jwt(time.time() + 3600)), FakeResponse(400))
+    vote_poll.login_and_get_token("alice", "pw", BASE_URL, client)
+    with pytest.raises(ValueError, match="Incorrect username or password"):
+        vote_poll.login_and_get_token("alice", "wrong", BASE_URL, client)
+    assert len(client.calls) == 2
+
+
+def test_token_near_expiry_is_refreshed():
+    stale = _jwt(time.time() + 10)
+    fresh = _jwt(time.time() + 3600)
+    client = FakeClient(_login_response(stale), _login_response(fresh))
+    vote_poll.login_and_get_token("alice", "pw", BASE_URL, client)
+    assert vote_poll.login_and_get_token("alice", "pw", BASE_URL, client) == fresh
+
+
+def test_token_without_exp_is_not_cached():
+    client = FakeClient(_login_response("opaque"), _login_response("opaque"))
+    vote_poll.login_and_get_token("alice", "pw", BASE_URL, client)
+    vote_poll.login_and_get_token("alice", "pw", BASE_URL, client)
+    assert len(client.calls) == 2